@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-14 14:42
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicate_tags(apps, schema_editor):
+    """Fold duplicate (user, name) tags into the oldest one."""
+    Tag = apps.get_model('core', 'Tag')
+    RecipeTags = apps.get_model('core', 'Recipe').tags.through
+
+    duplicates = Tag.objects.values('user_id', 'name').annotate(
+        count=Count('id'),
+        keep_id=Min('id'),
+    ).filter(count__gt=1)
+
+    for duplicate in duplicates:
+        keep_id = duplicate['keep_id']
+        dup_ids = list(
+            Tag.objects.filter(
+                user_id=duplicate['user_id'],
+                name=duplicate['name'],
+            ).exclude(id=keep_id).values_list('id', flat=True)
+        )
+
+        linked = set(
+            RecipeTags.objects.filter(tag_id=keep_id)
+            .values_list('recipe_id', flat=True)
+        )
+        recipe_ids = set(
+            RecipeTags.objects.filter(tag_id__in=dup_ids)
+            .values_list('recipe_id', flat=True)
+        ) - linked
+        RecipeTags.objects.bulk_create([
+            RecipeTags(recipe_id=recipe_id, tag_id=keep_id)
+            for recipe_id in recipe_ids
+        ])
+
+        Tag.objects.filter(id__in=dup_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_recipe_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_tags, migrations.RunPython.noop),
+    ]
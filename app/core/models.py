@@ -66,6 +66,11 @@ class Recipe(models.Model):
     tags = models.ManyToManyField('Tag')
     image = models.ImageField(null= True, upload_to=recipe_image_file_path)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-id'], name='recipe_user_id_desc'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -78,5 +83,8 @@ class Tag(models.Model):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        unique_together = ('user', 'name')
+
     def __str__(self):
         return self.name
\ No newline at end of file
@@ -0,0 +1,64 @@
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+
+from core.models import Recipe, Tag
+
+merge_duplicate_tags = import_module(
+    'core.migrations.0008_merge_duplicate_tags'
+).merge_duplicate_tags
+
+
+def create_recipe(user):
+
+    return Recipe.objects.create(
+        user=user,
+        title='Sample recipe',
+        time_minutes=5,
+        price=Decimal('1.50'),
+    )
+
+
+class MergeDuplicateTagsTests(TransactionTestCase):
+
+    def setUp(self):
+        # Drop the (user, name) constraint so duplicates can be seeded the
+        # way they existed before 0009_tag_user_name_unique.
+        with connection.schema_editor() as editor:
+            editor.alter_unique_together(Tag, [('user', 'name')], [])
+
+    def tearDown(self):
+        Tag.objects.all().delete()
+        with connection.schema_editor() as editor:
+            editor.alter_unique_together(Tag, [], [('user', 'name')])
+
+    def test_merge_duplicate_tags(self):
+
+        user = get_user_model().objects.create_user('t@ex.com', 'pass123')
+        other_user = get_user_model().objects.create_user('o@ex.com', 'pass1')
+        keep = Tag.objects.create(user=user, name='a')
+        dup1 = Tag.objects.create(user=user, name='a')
+        dup2 = Tag.objects.create(user=user, name='a')
+        other = Tag.objects.create(user=user, name='b')
+        other_user_tag = Tag.objects.create(user=other_user, name='a')
+
+        r1 = create_recipe(user)
+        r2 = create_recipe(user)
+        r3 = create_recipe(user)
+        r1.tags.add(keep, dup1)
+        r2.tags.add(dup1, dup2)
+        r3.tags.add(dup2, other)
+
+        merge_duplicate_tags(apps, None)
+
+        self.assertCountEqual(
+            Tag.objects.values_list('id', flat=True),
+            [keep.id, other.id, other_user_tag.id],
+        )
+        self.assertEqual(list(r1.tags.all()), [keep])
+        self.assertEqual(list(r2.tags.all()), [keep])
+        self.assertCountEqual(r3.tags.all(), [keep, other])
@@ -11,6 +11,27 @@ class TagSerializer(serializers.ModelSerializer):
         fields= ['id', 'name']
         read_only_fields= ['id']
 
+    def validate_name(self, value):
+
+        # Nested recipe tags are looked up by name, so only standalone
+        # tag updates can collide with an existing tag.
+        if self.root is not self:
+            return value
+
+        tags = Tag.objects.filter(
+            user=self.context['request'].user,
+            name=value,
+        )
+        if self.instance is not None:
+            tags = tags.exclude(pk=self.instance.pk)
+
+        if tags.exists():
+            raise serializers.ValidationError(
+                'Tag with this name already exists.'
+            )
+
+        return value
+
 class RecipeSerializer(serializers.ModelSerializer):
 
     tags = TagSerializer(many= True, required = False)
@@ -23,13 +44,20 @@ class RecipeSerializer(serializers.ModelSerializer):
     def _get_or_create_tags(self, tags, recipe):
 
         auth_user = self.context['request'].user
+        names = {tag['name'] for tag in tags}
 
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user = auth_user,
-                **tag,
-            )
-            recipe.tags.add(tag_obj)
+        existing = set(
+            Tag.objects.filter(
+                user=auth_user,
+                name__in=names,
+            ).values_list('name', flat=True)
+        )
+        Tag.objects.bulk_create(
+            [Tag(user=auth_user, name=name) for name in names - existing],
+            ignore_conflicts=True,
+        )
+
+        recipe.tags.set(Tag.objects.filter(user=auth_user, name__in=names))
 
 
     def create(self, validated_data):
@@ -44,7 +72,6 @@ class RecipeSerializer(serializers.ModelSerializer):
 
         tags = validated_data.pop('tags', None)
         if tags is not None:
-            instance.tags.clear()
             self._get_or_create_tags(tags, instance)
 
         for attr, value in validated_data.items():
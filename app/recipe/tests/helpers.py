@@ -0,0 +1,19 @@
+"""
+Reversed URLs shared by the recipe API tests.
+"""
+from django.urls import reverse
+
+RECIPE_URL = reverse('recipe:recipe-list')
+TAG_URL = reverse('recipe:tag-list')
+
+
+def detail_url(recipe_id):
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+def tag_detail_url(tag_id):
+    return reverse('recipe:tag-detail', args=[tag_id])
+
+
+def image_upload_url(recipe_id):
+    return reverse('recipe:recipe-upload-image', args=[recipe_id])
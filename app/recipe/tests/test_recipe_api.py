@@ -1,51 +1,79 @@
 from decimal import Decimal
-import tempfile
+import io
 import os
 
 from PIL import Image
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from core.models import Tag, Recipe
 
+from recipe.views import RecipeViewSet
 from recipe.serializers import (
     RecipeSerializer,
     RecipeDetailSerializer,
 )
+from recipe.tests.helpers import (
+    RECIPE_URL,
+    detail_url,
+    image_upload_url,
+)
 
-RECIPE_URL = reverse('recipe:recipe-list')
 
-def detail_url(recipe_id):
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+def _encode_once():
 
+    buf = io.BytesIO()
+    Image.new('RGB', (10, 10)).save(buf, 'JPEG')
+    return buf.getvalue()
 
 
-def image_upload_url(recipe_id):
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+_JPEG_BYTES = _encode_once()
 
 
-def create_recipe(user, **params):
+RECIPE_DEFAULTS = {
+    'title': 'Sample recipe title',
+    'time_minutes': 22,
+    'price': Decimal('5.24'),
+    'description': 'Sample descriptionss ',
+    'link': 'www.gmail.com',
+}
 
-    defaults = {
-        'title': 'Sample recipe title',
-        'time_minutes': 22,
-        'price': Decimal('5.24'),
-        'description': 'Sample descriptionss ',
-        'link': 'www.gmail.com',
-    }
 
-    defaults.update(params)
+def create_recipe(user, **params):
+
+    defaults = {**RECIPE_DEFAULTS, **params}
 
     recipe = Recipe.objects.create(user = user, **defaults)
     return recipe
 
 
-class PublicRecipeAPITests(TestCase):
+def list_recipes(user, params=None):
+    view = RecipeViewSet.as_view({'get': 'list'})
+    req = APIRequestFactory().get(RECIPE_URL, params)
+    force_authenticate(req, user=user)
+
+    return view(req)
+
+
+def bulk_create_recipes(user, n, **params):
+
+    defaults = {**RECIPE_DEFAULTS, **params}
+
+    return Recipe.objects.bulk_create(
+        [Recipe(user = user, **defaults) for _ in range(n)]
+    )
+
+
+class PublicRecipeAPITests(SimpleTestCase):
 
     def setUp(self):
         self.client = APIClient()
@@ -57,20 +85,22 @@ class PublicRecipeAPITests(TestCase):
 
 class PrivateRecipeAPITests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'tes@example.com',
             'test123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrive_recipes(self):
 
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        bulk_create_recipes(user=self.user, n=2)
 
-        res = self.client.get(RECIPE_URL)
+        res = list_recipes(self.user)
 
         recipes = Recipe.objects.all().order_by('-id')
         serializer = RecipeSerializer(recipes,many= True)
@@ -86,7 +116,7 @@ class PrivateRecipeAPITests(TestCase):
         create_recipe(user=other_user)
         create_recipe(user=self.user)
 
-        res = self.client.get(RECIPE_URL)
+        res = list_recipes(self.user)
 
         recipes = Recipe.objects.filter(user= self.user)
 
@@ -114,11 +144,13 @@ class PrivateRecipeAPITests(TestCase):
 
         res = self.client.post(RECIPE_URL, payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.get(id= res.data['id'])
+        recipe = Recipe.objects.only(
+            'title', 'time_minutes', 'price', 'user_id'
+        ).get(id= res.data['id'])
 
         for k,v in payload.items():
             self.assertEqual(getattr(recipe, k), v)
-        self.assertEqual(recipe.user, self.user)
+        self.assertEqual(recipe.user_id, self.user.id)
 
 
     def test_create_recipe_with_tags(self):
@@ -140,15 +172,28 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(recipes.count(), 1)
         recipe = recipes[0]
 
-        self.assertEqual(recipe.tags.count(), 2)
+        actual = set(
+            recipe.tags.filter(user= self.user).values_list('name', flat=True)
+        )
+        self.assertEqual(actual, {'thai', 'lunch'})
 
-        for tag in payload['tags']:
+    def test_create_recipe_with_existing_tags(self):
 
-            exists = recipe.tags.filter(
-                name = tag['name'],
-                user = self.user,
-            ).exists()
-            self.assertTrue(exists)
+        tag_indian = Tag.objects.create(user=self.user, name='indian')
+        payload = {
+        'title': 'Pongal',
+        'time_minutes': 60,
+        'price': Decimal('4.50'),
+        'tags': [{'name': 'indian'}, {'name': 'breakfast'}, {'name': 'indian'}]
+        }
+
+        res = self.client.post(RECIPE_URL, payload, format= 'json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipe = Recipe.objects.only('id').get(user= self.user)
+        self.assertEqual(recipe.tags.count(), 2)
+        self.assertIn(tag_indian, recipe.tags.all())
+        self.assertEqual(Tag.objects.filter(user= self.user).count(), 2)
 
     def test_create_tag_on_update(self):
 
@@ -208,16 +253,67 @@ class PrivateRecipeAPITests(TestCase):
 
         r3 = create_recipe(user=self.user, title= 'recipe345 me')
 
+        params = {'tags': f'{tag1.id},{tag2.id}'}
+        res = list_recipes(self.user, params)
+
+        s1, s2, s3 = RecipeSerializer([r1, r2, r3], many= True).data
+
+        self.assertIn(s1, res.data)
+        self.assertIn(s2, res.data)
+        self.assertNotIn(s3, res.data)
+
+    def test_filter_by_tags_no_duplicates(self):
+
+        recipe = create_recipe(user=self.user)
+        tag1 = Tag.objects.create(user=self.user, name='tag11')
+        tag2 = Tag.objects.create(user=self.user, name='tag21')
+        recipe.tags.add(tag1, tag2)
+
         params = {'tags': f'{tag1.id},{tag2.id}'}
         res = self.client.get(RECIPE_URL, params)
 
-        s1 = RecipeSerializer(r1)
-        s2 = RecipeSerializer(r2)
-        s3 = RecipeSerializer(r3)
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]['id'], recipe.id)
+
+    def test_filter_by_tags_with_whitespace(self):
+
+        r1 = create_recipe(user=self.user, title='recipe1')
+        r2 = create_recipe(user=self.user, title='recipe2')
+        tag1 = Tag.objects.create(user=self.user, name='tag11')
+        tag2 = Tag.objects.create(user=self.user, name='tag21')
+        r1.tags.add(tag1)
+        r2.tags.add(tag2)
+
+        res = self.client.get(RECIPE_URL, {'tags': f'{tag1.id}, {tag2.id} '})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            [recipe['id'] for recipe in res.data],
+            [r1.id, r2.id],
+        )
+
+    def test_filter_by_invalid_tags(self):
 
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        recipe = create_recipe(user=self.user)
+        tag = Tag.objects.create(user=self.user, name='tag11')
+        recipe.tags.add(tag)
+
+        res = self.client.get(RECIPE_URL, {'tags': f'{tag.id},abc'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, [])
+
+    def test_list_recipes_tags_prefetched(self):
+
+        for i in range(3):
+            recipe = create_recipe(user=self.user)
+            recipe.tags.add(Tag.objects.create(user=self.user, name=f'tag{i}'))
+
+        with self.assertNumQueries(2):
+            res = self.client.get(RECIPE_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 3)
 
 
 
@@ -225,12 +321,15 @@ class PrivateRecipeAPITests(TestCase):
 class ImageUploadTests(TestCase):
 
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'tes@example.com',
             'test123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
         self.recipe = create_recipe(user=self.user)
 
@@ -242,14 +341,10 @@ class ImageUploadTests(TestCase):
 
         url = image_upload_url(self.recipe.id)
 
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as image_file:
-
-            img = Image.new('RGB', (10, 10))
-            img.save(image_file)
-            image_file.seek(0)
-            payload = {'image': image_file}
+        image_file = SimpleUploadedFile('t.jpg', _JPEG_BYTES, 'image/jpeg')
+        payload = {'image': image_file}
 
-            res = self.client.post(url, payload, format='multipart')
+        res = self.client.post(url, payload, format='multipart')
 
         self.recipe.refresh_from_db()
         self.assertEqual(res.status_code, status.HTTP_200_OK)
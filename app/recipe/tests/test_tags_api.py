@@ -1,6 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -8,19 +7,17 @@ from rest_framework.test import APIClient
 from core.models import Tag
 
 from recipe.serializers import TagSerializer
-
-TAG_URL = reverse('recipe:tag-list')
-
-
-def detail_url(tag_id):
-    return reverse('recipe:tag-detail', args=[tag_id])
+from recipe.tests.helpers import (
+    TAG_URL,
+    tag_detail_url as detail_url,
+)
 
 
 def create_user(email='tes@ex.com', password='testpa'):
 
     return get_user_model().objects.create_user(email=email, password=password)
 
-class PublicTagAPITests(TestCase):
+class PublicTagAPITests(SimpleTestCase):
 
     def setUp(self):
         self.client = APIClient()
@@ -33,9 +30,12 @@ class PublicTagAPITests(TestCase):
 
 class PrivateTagAPITests(TestCase):
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrive_tags(self):
@@ -78,10 +78,23 @@ class PrivateTagAPITests(TestCase):
         res = self.client.patch(url, payload)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        tag.refresh_from_db()
+        tag.refresh_from_db(fields=['name'])
 
         self.assertEqual(tag.name, payload['name'])
 
+    def test_update_tag_duplicate_name(self):
+
+        Tag.objects.create(user= self.user, name='Dessert')
+        tag = Tag.objects.create(user= self.user, name='after dinner')
+
+        payload = {'name': 'Dessert'}
+        url = detail_url(tag.id)
+        res = self.client.patch(url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        tag.refresh_from_db(fields=['name'])
+        self.assertEqual(tag.name, 'after dinner')
+
     def test_delete_tag(self):
 
         tag = Tag.objects.create(user= self.user, name='after dinner')
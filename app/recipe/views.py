@@ -1,3 +1,5 @@
+import re
+
 from drf_spectacular.utils import (
     extend_schema_view,
     extend_schema,
@@ -5,6 +7,12 @@ from drf_spectacular.utils import (
     OpenApiTypes,
 )
 
+from django.db.models import (
+    Exists,
+    OuterRef,
+    Prefetch,
+)
+
 from rest_framework import (
     viewsets,
     mixins,
@@ -23,6 +31,8 @@ from core.models import (
 
 from recipe import serializers
 
+_TAG_RE = re.compile(r'\s*\d+\s*(?:,\s*\d+\s*)*')
+
 class RecipeViewSet(viewsets.ModelViewSet):
 
     serializer_class = serializers.RecipeDetailSerializer
@@ -31,20 +41,41 @@ class RecipeViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def _params_to_ints(self, qs):
-        return [int(str_id) for str_id in qs.split(',')]
+        if not _TAG_RE.fullmatch(qs):
+            return ()
+        return tuple(map(int, qs.split(',')))
 
 
     def get_queryset(self):
 
+        if hasattr(self, '_cached_qs'):
+            return self._cached_qs
+
         tags = self.request.query_params.get('tags')
-        queryset = self.queryset
+        queryset = self.queryset.filter(user=self.request.user)
 
         if tags:
             tag_ids = self._params_to_ints(tags)
-            queryset = queryset.filter(tags__id__in=tag_ids)
+            queryset = queryset.filter(Exists(
+                Recipe.tags.through.objects.filter(
+                    recipe_id=OuterRef('pk'),
+                    tag_id__in=tag_ids,
+                )
+            ))
 
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'title', 'time_minutes', 'price', 'link', 'user_id',
+            )
+
+        self._cached_qs = queryset.prefetch_related(
+            Prefetch(
+                'tags',
+                queryset=Tag.objects.only('id', 'name', 'user_id'),
+            )
+        ).order_by('-id')
 
-        return queryset.filter(user=self.request.user).order_by('-id').distinct()
+        return self._cached_qs
 
 
     def get_serializer_class(self):
@@ -60,7 +91,7 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
         serializer.save(user= self.request.user)
 
-    @action(methods=['POST'], detail=True, url_path = 'uploa-dimage')
+    @action(methods=['POST'], detail=True, url_path = 'upload-image')
     def upload_image(self, request, pk= None):
 
         recipe = self.get_object()
@@ -88,4 +119,11 @@ class TagViewSet(
 
     def get_queryset(self):
 
-        return self.queryset.filter(user=self.request.user).order_by('-name')
\ No newline at end of file
+        if hasattr(self, '_cached_qs'):
+            return self._cached_qs
+
+        self._cached_qs = self.queryset.filter(
+            user=self.request.user
+        ).order_by('-name')
+
+        return self._cached_qs